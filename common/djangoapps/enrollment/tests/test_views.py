@@ -577,6 +577,12 @@ class EnrollmentTest(EnrollmentTestMixin, ModuleStoreTestCase, APITestCase, Ente
         self.assertTrue(is_active)
         self.assertEqual(course_mode, 'professional')
 
+    def test_server_enrollment_reuses_enrollment_for_audit(self):
+        """A successful server-to-server enrollment looks the enrollment up only once."""
+        with patch.object(api, 'get_enrollment', wraps=api.get_enrollment) as mock_get_enrollment:
+            self.assert_enrollment_status(as_server=True)
+        self.assertEqual(mock_get_enrollment.call_count, 1)
+
     def test_enrollment_includes_expired_verified(self):
         """With the right API key, request that expired course verifications are still returned. """
         # Create a honor mode for a course.
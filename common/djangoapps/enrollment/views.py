@@ -39,6 +39,8 @@ log = logging.getLogger(__name__)
 REQUIRED_ATTRIBUTES = {
     "credit": ["credit:provider_id"],
 }
+# Required attributes per mode, precomputed so that POST requests only build the set of supplied attributes.
+_REQUIRED_ATTRIBUTE_SETS = {mode: frozenset(attrs) for mode, attrs in REQUIRED_ATTRIBUTES.items()}
 
 
 class EnrollmentCrossDomainSessionAuth(SessionAuthenticationAllowInactiveUser, SessionAuthenticationCrossDomainCsrf):
@@ -569,6 +571,9 @@ class EnrollmentListView(APIView, ApiKeyPermissionMixIn):
         if embargo_response:
             return embargo_response
 
+        # The enrollment state reported to the audit log. Successful requests reuse the enrollment
+        # returned by the API; every other path looks it up again once the request has finished.
+        current_enrollment = None
         try:
             is_active = request.data.get('is_active')
             # Check if the requested activation status is None or a Boolean
@@ -582,7 +587,7 @@ class EnrollmentListView(APIView, ApiKeyPermissionMixIn):
 
             enterprise_course_consent = request.data.get('enterprise_course_consent')
             # Check if the enterprise_course_enrollment is a boolean
-            if has_api_key_permissions and enterprise_enabled() and enterprise_course_consent is not None:
+            if has_api_key_permissions and enterprise_course_consent is not None and enterprise_enabled():
                 if not isinstance(enterprise_course_consent, bool):
                     return Response(
                         status=status.HTTP_400_BAD_REQUEST,
@@ -609,11 +614,11 @@ class EnrollmentListView(APIView, ApiKeyPermissionMixIn):
             active_changed = enrollment and is_active is not None and enrollment['is_active'] != is_active
             missing_attrs = []
             if enrollment_attributes:
-                actual_attrs = [
+                actual_attrs = {
                     u"{namespace}:{name}".format(**attr)
                     for attr in enrollment_attributes
-                ]
-                missing_attrs = set(REQUIRED_ATTRIBUTES.get(mode, [])) - set(actual_attrs)
+                }
+                missing_attrs = _REQUIRED_ATTRIBUTE_SETS.get(mode, frozenset()) - actual_attrs
             if has_api_key_permissions and (mode_changed or active_changed):
                 if mode_changed and active_changed and not is_active:
                     # if the requester wanted to deactivate but specified the wrong mode, fail
@@ -648,6 +653,7 @@ class EnrollmentListView(APIView, ApiKeyPermissionMixIn):
                     is_active=is_active,
                     enrollment_attributes=enrollment_attributes
                 )
+            current_enrollment = response
 
             email_opt_in = request.data.get('email_opt_in', None)
             if email_opt_in is not None:
@@ -690,7 +696,8 @@ class EnrollmentListView(APIView, ApiKeyPermissionMixIn):
         finally:
             # Assumes that the ecommerce service uses an API key to authenticate.
             if has_api_key_permissions:
-                current_enrollment = api.get_enrollment(username, unicode(course_id))
+                if current_enrollment is None:
+                    current_enrollment = api.get_enrollment(username, unicode(course_id))
                 audit_log(
                     'enrollment_change_requested',
                     course_id=unicode(course_id),